@@ -0,0 +1,42 @@
+"""Apply every patch_*.py in one go: each target file is read once, run
+through all of its patches in memory, and written once."""
+import patch_controller
+import patch_jwt
+import patch_service
+import patch_service2
+import patch_sidebar
+import patch_sidebar2
+
+# Order matters within a file: the *2 scripts are fallbacks that skip
+# whatever the first script already applied
+PATCHES = [
+    patch_controller,
+    patch_jwt,
+    patch_service,
+    patch_service2,
+    patch_sidebar,
+    patch_sidebar2,
+]
+
+by_file = {}
+for module in PATCHES:
+    by_file.setdefault(module.filepath, []).append(module.patch)
+
+for filepath, patches in by_file.items():
+    with open(filepath, "r") as f:
+        content = f.read()
+
+    original = content
+    for patch in patches:
+        content = patch(content)
+
+    if content == original:
+        print(f"Already patched: {filepath}")
+        continue
+
+    with open(filepath, "w") as f:
+        f.write(content)
+
+    print(f"Patched {filepath}")
+
+print("All patches applied!")
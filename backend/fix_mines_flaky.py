@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Fix mines flaky test by mocking generateMinePositions for deterministic results"""
+from pathlib import Path
 
-with open('src/modules/mines/mines.service.spec.ts', 'r') as f:
-    content = f.read()
+spec_path = Path('src/modules/mines/mines.service.spec.ts')
+content = spec_path.read_text()
 
 # Strategy: Instead of mocking generateMinePositions (which may not be public),
 # make the test more resilient by retrying with a new game if the first tile is a mine
@@ -45,9 +46,13 @@ new_test = """    it('should reveal a safe tile and increase multiplier', async
       }
       expect(found).toBe(true);"""
 
-content = content.replace(old_test, new_test)
+# Locate the block once and splice; the test only appears once in the spec
+idx = content.find(old_test)
 
-with open('src/modules/mines/mines.service.spec.ts', 'w') as f:
-    f.write(content)
-
-print('DONE - mines flaky test fixed')
+# Only touch the spec when something changed; re-runs leave it (and its mtime) alone
+if idx != -1:
+    content = content[:idx] + new_test + content[idx + len(old_test):]
+    spec_path.write_text(content)
+    print('DONE - mines flaky test fixed')
+else:
+    print('SKIP - flaky test block not found (already fixed?)')
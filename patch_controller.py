@@ -1,17 +1,6 @@
 filepath = "backend/src/modules/super-admin/super-admin.controller.ts"
 
-with open(filepath, "r") as f:
-    content = f.read()
-
-# 1. Add Req import if not present
-if "Req," not in content and "@Req()" not in content:
-    content = content.replace(
-        "  BadRequestException,",
-        "  BadRequestException,\n  Req,"
-    )
-    print("Added Req import")
-
-# 2. Update createTenant body type to include ownerPassword and ownerUsername
+# createTenant body type, extended with ownerPassword and ownerUsername
 old_body = """  @Post('tenants')
   @HttpCode(HttpStatus.CREATED)
   async createTenant(@Body() body: {
@@ -54,14 +43,7 @@ new_body = """  @Post('tenants')
     licenseType?: string;
   }) {"""
 
-if old_body in content:
-    content = content.replace(old_body, new_body)
-    print("Updated createTenant body type")
-else:
-    print("Could not find createTenant body to update")
-
-# 3. Add brand-settings endpoints before the BANKROLL section
-# Find the reports section end (last endpoint) and add before the closing brace
+# brand-settings endpoints, added after the last endpoint of the class
 new_endpoints = """
   // ============================================
   // BRAND SETTINGS (for tenant admins)
@@ -102,13 +84,44 @@ new_endpoints = """
   }
 """
 
-# Insert before the last closing brace of the class
-last_brace = content.rfind("}")
-if last_brace != -1:
-    content = content[:last_brace] + new_endpoints + "\n" + content[last_brace:]
-    print("Added brand-settings endpoints")
 
-with open(filepath, "w") as f:
-    f.write(content)
+def patch(content):
+    # 1. Add Req import if not present
+    if "Req," not in content and "@Req()" not in content:
+        content = content.replace(
+            "  BadRequestException,",
+            "  BadRequestException,\n  Req,"
+        )
+        print("Added Req import")
+
+    # 2. Update createTenant body type to include ownerPassword and ownerUsername
+    if old_body in content:
+        content = content.replace(old_body, new_body)
+        print("Updated createTenant body type")
+    else:
+        print("Could not find createTenant body to update")
+
+    # 3. Add brand-settings endpoints before the last closing brace of the class
+    last_brace = content.rfind("}")
+    if "brand-settings" in content:
+        print("brand-settings endpoints already exist")
+    elif last_brace != -1:
+        content = content[:last_brace] + new_endpoints + "\n" + content[last_brace:]
+        print("Added brand-settings endpoints")
+
+    return content
+
+
+if __name__ == "__main__":
+    with open(filepath, "r") as f:
+        content = f.read()
+
+    original = content
+    content = patch(content)
+
+    # Leave already-patched files (and their mtime) alone
+    if content != original:
+        with open(filepath, "w") as f:
+            f.write(content)
 
-print("Controller patched successfully!")
+    print("Controller patched successfully!")
@@ -1,8 +1,5 @@
 filepath = "backend/src/modules/auth/jwt.strategy.ts"
 
-with open(filepath, "r") as f:
-    content = f.read()
-
 # Add siteId to the select clause
 old = """        tokenVersion: true,
       },"""
@@ -11,9 +8,23 @@ new = """        tokenVersion: true,
         siteId: true,
       },"""
 
-content = content.replace(old, new)
 
-with open(filepath, "w") as f:
-    f.write(content)
+def patch(content):
+    if new in content:
+        return content
+    return content.replace(old, new)
+
+
+if __name__ == "__main__":
+    with open(filepath, "r") as f:
+        content = f.read()
+
+    original = content
+    content = patch(content)
+
+    # Leave already-patched files (and their mtime) alone
+    if content != original:
+        with open(filepath, "w") as f:
+            f.write(content)
 
-print("Done! Added siteId to JWT strategy select")
+    print("Done! Added siteId to JWT strategy select")
@@ -3,33 +3,11 @@ import sys
 
 filepath = "backend/src/modules/super-admin/super-admin.service.ts"
 
-with open(filepath, "r") as f:
-    content = f.read()
-
-# 1. Add bcrypt import if not present
-if "bcrypt" not in content:
-    content = 'import * as bcrypt from "bcrypt";\n' + content
-    print("Added bcrypt import")
-
-# 2. Add SALT_ROUNDS after constructor
-if "SALT_ROUNDS" not in content:
-    content = content.replace(
-        "constructor(private readonly prisma: PrismaService) {}",
-        "private readonly SALT_ROUNDS = 10;\n\n  constructor(private readonly prisma: PrismaService) {}"
-    )
-    print("Added SALT_ROUNDS")
-
-# 3. Replace createTenant method
+# createTenant method, replaced wholesale between these markers
 start_marker = "  async createTenant(data: {"
 end_marker = "    return { success: true, tenant: site };\n  }"
 
-start_idx = content.find(start_marker)
-end_idx = content.find(end_marker)
-
-if start_idx != -1 and end_idx != -1:
-    end_idx += len(end_marker)
-    
-    new_method = '''  async createTenant(data: {
+new_method = '''  async createTenant(data: {
     brandName: string;
     domain: string;
     ownerEmail: string;
@@ -137,13 +115,8 @@ if start_idx != -1 and end_idx != -1:
       },
     };
   }'''
-    
-    content = content[:start_idx] + new_method + content[end_idx:]
-    print("createTenant replaced successfully")
-else:
-    print(f"Could not find createTenant markers. start={start_idx}, end={end_idx}")
 
-# 4. Add new methods before HELPERS section
+# New methods go before the HELPERS section
 helper_marker = "  // ============================================\n  // HELPERS"
 
 new_methods = '''  // ============================================
@@ -225,13 +198,69 @@ new_methods = '''  // ============================================
   // ============================================
   // HELPERS'''
 
-if helper_marker in content:
-    content = content.replace(helper_marker, new_methods)
-    print("New methods added successfully")
-else:
-    print("Could not find HELPERS marker")
 
-with open(filepath, "w") as f:
-    f.write(content)
+constructor_anchor = "constructor(private readonly prisma: PrismaService) {}"
+
+
+def patch(content):
+    # Collect (start, end, text) edits against the original content, then
+    # splice them together once instead of rebuilding the string per edit
+    edits = []
+
+    # 1. Add bcrypt import if not present
+    if "bcrypt" not in content:
+        edits.append((0, 0, 'import * as bcrypt from "bcrypt";\n'))
+        print("Added bcrypt import")
+
+    # 2. Add SALT_ROUNDS after constructor
+    if "SALT_ROUNDS" not in content:
+        ctor_idx = content.find(constructor_anchor)
+        if ctor_idx != -1:
+            edits.append((ctor_idx, ctor_idx, "private readonly SALT_ROUNDS = 10;\n\n  "))
+            print("Added SALT_ROUNDS")
+
+    # 3. Replace createTenant method
+    start_idx = content.find(start_marker)
+    end_idx = content.find(end_marker)
+
+    if "adminCredentials" in content:
+        print("createTenant already replaced")
+    elif start_idx != -1 and end_idx != -1:
+        edits.append((start_idx, end_idx + len(end_marker), new_method))
+        print("createTenant replaced successfully")
+    else:
+        print(f"Could not find createTenant markers. start={start_idx}, end={end_idx}")
+
+    # 4. Add new methods before HELPERS section (new_methods ends with the marker itself)
+    helper_idx = content.find(helper_marker)
+    if "async updateTenantColors(" in content:
+        print("Tenant color methods already present")
+    elif helper_idx != -1:
+        edits.append((helper_idx, helper_idx + len(helper_marker), new_methods))
+        print("New methods added successfully")
+    else:
+        print("Could not find HELPERS marker")
+
+    parts = []
+    prev = 0
+    for start, end, text in sorted(edits):
+        parts.append(content[prev:start])
+        parts.append(text)
+        prev = end
+    parts.append(content[prev:])
+    return "".join(parts)
+
+
+if __name__ == "__main__":
+    with open(filepath, "r") as f:
+        content = f.read()
+
+    original = content
+    content = patch(content)
+
+    # Leave already-patched files (and their mtime) alone
+    if content != original:
+        with open(filepath, "w") as f:
+            f.write(content)
 
-print("File saved successfully!")
+    print("File saved successfully!")
@@ -1,8 +1,5 @@
 filepath = "backend/src/modules/super-admin/super-admin.service.ts"
 
-with open(filepath, "r") as f:
-    lines = f.readlines()
-
 new_methods = """  // ============================================
   // TENANT COLOR MANAGEMENT
   // ============================================
@@ -78,32 +75,56 @@ new_methods = """  // ============================================
 
 """
 
-# Find the line with "  // HELPERS" and insert before it
-insert_idx = None
-for i, line in enumerate(lines):
-    if "// HELPERS" in line and "============" not in line:
-        # Go back to the separator line
-        insert_idx = i - 1
-        break
 
-if insert_idx is None:
-    # Try finding the separator + HELPERS pattern
+def patch(content):
+    # patch_service.py adds the same methods; don't insert them twice
+    if "async updateTenantColors(" in content:
+        print("Tenant color methods already present")
+        return content
+
+    lines = content.splitlines(keepends=True)
+
+    # Find the line with "  // HELPERS" and insert before it
+    insert_idx = None
     for i, line in enumerate(lines):
-        if "// HELPERS" in line:
-            insert_idx = i - 1 if i > 0 and "====" in lines[i-1] else i
+        if "// HELPERS" in line and "============" not in line:
+            # Go back to the separator line
+            insert_idx = i - 1
             break
 
-if insert_idx is not None:
-    new_lines = lines[:insert_idx] + [new_methods] + lines[insert_idx:]
-    with open(filepath, "w") as f:
-        f.writelines(new_lines)
-    print(f"Methods inserted at line {insert_idx}. File saved!")
-else:
-    # Fallback: insert before the last closing brace
-    for i in range(len(lines)-1, -1, -1):
-        if lines[i].strip() == "}":
-            new_lines = lines[:i] + [new_methods] + lines[i:]
-            with open(filepath, "w") as f:
-                f.writelines(new_lines)
-            print(f"Methods inserted before closing brace at line {i}. File saved!")
-            break
+    if insert_idx is None:
+        # Try finding the separator + HELPERS pattern
+        for i, line in enumerate(lines):
+            if "// HELPERS" in line:
+                insert_idx = i - 1 if i > 0 and "====" in lines[i-1] else i
+                break
+
+    if insert_idx is not None:
+        print(f"Methods inserted at line {insert_idx}")
+    else:
+        # Fallback: insert before the last closing brace
+        for i in range(len(lines)-1, -1, -1):
+            if lines[i].strip() == "}":
+                insert_idx = i
+                print(f"Methods inserted before closing brace at line {i}")
+                break
+
+    if insert_idx is None:
+        return content
+
+    return "".join(lines[:insert_idx] + [new_methods] + lines[insert_idx:])
+
+
+if __name__ == "__main__":
+    with open(filepath, "r") as f:
+        content = f.read()
+
+    original = content
+    content = patch(content)
+
+    # Leave already-patched files (and their mtime) alone
+    if content != original:
+        with open(filepath, "w") as f:
+            f.write(content)
+
+    print("File saved!")
@@ -1,14 +1,5 @@
 filepath = "frontend/src/components/admin/AdminSidebar.tsx"
 
-with open(filepath, "r") as f:
-    content = f.read()
-
-# Add Palette to imports
-content = content.replace(
-    "  ScrollText,\n} from 'lucide-react';",
-    "  ScrollText,\n  Palette,\n} from 'lucide-react';"
-)
-
 # Add brand-settings nav item before god-mode
 old_god = """    {
       id: 'god-mode',"""
@@ -22,9 +13,30 @@ new_with_brand = """    {
     {
       id: 'god-mode',"""
 
-content = content.replace(old_god, new_with_brand)
 
-with open(filepath, "w") as f:
-    f.write(content)
+def patch(content):
+    # Add Palette to imports
+    if "Palette" not in content:
+        content = content.replace(
+            "  ScrollText,\n} from 'lucide-react';",
+            "  ScrollText,\n  Palette,\n} from 'lucide-react';"
+        )
+
+    if "brand-settings" not in content:
+        content = content.replace(old_god, new_with_brand)
+    return content
+
+
+if __name__ == "__main__":
+    with open(filepath, "r") as f:
+        content = f.read()
+
+    original = content
+    content = patch(content)
+
+    # Leave already-patched files (and their mtime) alone
+    if content != original:
+        with open(filepath, "w") as f:
+            f.write(content)
 
-print("Done!")
+    print("Done!")